@@ -5,9 +5,11 @@ def main():
     parser = argparse.ArgumentParser(description='PMLR BibTeX validator and fixer')
     parser.add_argument('input', help='Input BibTeX file')
     parser.add_argument('output', help='Output BibTeX file')
+    parser.add_argument('--no-parallel', action='store_true',
+                        help='Fix text fields in a single process, even for large files')
     args = parser.parse_args()
     
-    check_and_fix_bibtex(args.input, args.output)
+    check_and_fix_bibtex(args.input, args.output, parallel=not args.no_parallel)
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
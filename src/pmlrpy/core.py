@@ -1,18 +1,29 @@
 import re
-import bibtexparser
 import logging
 from bibtexparser.bparser import BibTexParser
 from bibtexparser.bwriter import BibTexWriter
 import unicodedata
 import os
 import shutil
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
-# Set up logging
+from .loader import load_bibtex
+
+# Set up logging - the log file only gets warnings and above unless
+# PMLRPY_LOG_LEVEL asks for more (e.g. DEBUG to trace every entry)
+log_level = os.environ.get('PMLRPY_LOG_LEVEL', 'WARNING').upper()
+unknown_log_level = log_level not in logging.getLevelNamesMapping()
+# delay=True so the log file is only created once something is logged to it
+file_handler = logging.FileHandler('pmlrpy.log', delay=True)
+file_handler.setLevel(logging.WARNING if unknown_log_level else log_level)
 logging.basicConfig(
-    level=logging.DEBUG,  # Base level for file logging
+    level=min(logging.INFO, file_handler.level),  # Base level for file and console logging
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('pmlrpy.log'),
+        file_handler,
     ]
 )
 
@@ -22,21 +33,324 @@ console_handler.setLevel(logging.INFO)  # Only show INFO and above in console
 console_handler.setFormatter(logging.Formatter('%(levelname)s - %(message)s'))
 logging.getLogger().addHandler(console_handler)
 
-REQUIRED_PROCEEDINGS_FIELDS = {
+if unknown_log_level:
+    logging.warning(f"Unknown PMLRPY_LOG_LEVEL {log_level!r}, logging warnings and above to pmlrpy.log")
+
+# Entry types as normalized by check_and_fix_bibtex (title case, interned)
+PROCEEDINGS = sys.intern('Proceedings')
+INPROCEEDINGS = sys.intern('Inproceedings')
+
+REQUIRED_PROCEEDINGS_FIELDS = frozenset({
     'booktitle', 'name', 'shortname', 'year', 'editor', 
     'volume', 'start', 'end', 'published', 'address', 'conference_url'
+})
+
+# Unicode replacements (for all fields)
+UNICODE_REPLACEMENTS = {
+    # German/Swedish/Finnish umlauts
+    'ä': '{\\"{a}}',
+    'ë': '{\\"{e}}',
+    'ï': '{\\"{i}}',
+    'ö': '{\\"{o}}',
+    'ü': '{\\"{u}}',
+    'ÿ': '{\\"{y}}',
+    'Ä': '{\\"{A}}',
+    'Ë': '{\\"{E}}',
+    'Ï': '{\\"{I}}',
+    'Ö': '{\\"{O}}',
+    'Ü': '{\\"{U}}',
+    'Ÿ': '{\\"{Y}}',
+
+    # Acute accents
+    'á': '{\\\'{a}}',
+    'é': '{\\\'{e}}',
+    'í': '{\\\'{i}}',
+    'ó': '{\\\'{o}}',
+    'ú': '{\\\'{u}}',
+    'ý': '{\\\'{y}}',
+    'Á': '{\\\'{A}}',
+    'É': '{\\\'{E}}',
+    'Í': '{\\\'{I}}',
+    'Ó': '{\\\'{O}}',
+    'Ú': '{\\\'{U}}',
+    'Ý': '{\\\'{Y}}',
+
+    # Grave accents
+    'à': '{\\`{a}}',
+    'è': '{\\`{e}}',
+    'ì': '{\\`{i}}',
+    'ò': '{\\`{o}}',
+    'ù': '{\\`{u}}',
+    'À': '{\\`{A}}',
+    'È': '{\\`{E}}',
+    'Ì': '{\\`{I}}',
+    'Ò': '{\\`{O}}',
+    'Ù': '{\\`{U}}',
+
+    # Circumflex
+    'â': '{\\^{a}}',
+    'ê': '{\\^{e}}',
+    'î': '{\\^{i}}',
+    'ô': '{\\^{o}}',
+    'û': '{\\^{u}}',
+    'Â': '{\\^{A}}',
+    'Ê': '{\\^{E}}',
+    'Î': '{\\^{I}}',
+    'Ô': '{\\^{O}}',
+    'Û': '{\\^{U}}',
+
+    # Tilde
+    'ã': '{\\~{a}}',
+    'ñ': '{\\~{n}}',
+    'õ': '{\\~{o}}',
+    'Ã': '{\\~{A}}',
+    'Ñ': '{\\~{N}}',
+    'Õ': '{\\~{O}}',
+
+    # Polish specific
+    'ą': '\\k{a}',
+    'ę': '\\k{e}',
+    'ć': "\\'c",
+    'ł': '\\l{}',
+    'ń': "\\'n",
+    'ś': "\\'s",
+    'ź': "\\'z",
+    'ż': '\\.z',
+    'Ą': '\\k{A}',
+    'Ę': '\\k{E}',
+    'Ć': "\\'C",
+    'Ł': '\\L{}',
+    'Ń': "\\'N",
+    'Ś': "\\'S",
+    'Ź': "\\'Z",
+    'Ż': '\\.Z',
+
+    # Czech/Slovak specific
+    'ř': '\\v{r}',
+    'š': '\\v{s}',
+    'ť': '\\v{t}',
+    'ď': '\\v{d}',
+    'Ř': '\\v{R}',
+    'Š': '\\v{S}',
+    'Ť': '\\v{T}',
+    'Ď': '\\v{D}',
+
+    # Danish/Norwegian specific
+    'ø': '\\o{}',
+    'å': '\\aa{}',
+    'Ø': '\\O{}',
+    'Å': '\\AA{}',
+
+    # Various quotation marks (ASCII quotes are handled by replace_quotes)
+    '‚': ",",     # low single quote
+    '„': ",,",    # low double quote
+
+    # Other special characters
+    'æ': '\\ae{}',
+    'Æ': '\\AE{}',
+    'œ': '\\oe{}',
+    'Œ': '\\OE{}',
+    'ß': '\\ss{}',
+    '¡': '!`',
+    '¿': '?`',
+
+    # Greek letters
+    'λ': '\\lambda',
+
+    # Additional characters found in corl24.bib
+    '\xa0': ' ',        # non-breaking space
+    'ç': '\\c{c}',      # c-cedilla
+    'ğ': '\\u{g}',      # g with breve
+    '≥': '$\\geq$',     # greater than or equal
+    '’': "'",           # right single quote
+    '\u201c': '``',          # left double quote (U+201C)
+    '\u201d': "''",          # right double quote (U+201D) 
+
+    # Dashes - specify exact Unicode values
+    '\u2013': '--',    # en-dash (–)
+    '\u2014': '---',   # em-dash (—)
+    '\u2212': '-',     # minus sign (−)
+}
+
+# PDF ligature replacements (common combinations that get merged in PDFs)
+PDF_LIGATURE_REPLACEMENTS = {
+    'ﬁ': 'fi',
+    'ﬂ': 'fl',
+    'ﬀ': 'ff',
+    'ﬃ': 'ffi',
+    'ﬄ': 'ffl',
+    'ﬅ': 'ft',
+    'ﬆ': 'st',
+    'Ꜳ': 'AA',
+    'ꜳ': 'aa',
+    'Ꜵ': 'AO',
+    'ꜵ': 'ao',
+    'Ꜷ': 'AU',
+    'ꜷ': 'au',
+    'Ꜹ': 'AV',
+    'ꜹ': 'av',
+    'Ꜻ': 'AY',
+    'ꜻ': 'ay',
+    'Ꜽ': 'OO',
+    'ꜽ': 'oo'
 }
 
-def get_unique_normalized_id(original_id, normalized_id, existing_ids):
-    """Generate a unique normalized ID by adding a suffix if needed."""
+# Combined translation table so each field is rewritten in a single pass
+TEXT_TRANS = str.maketrans({**UNICODE_REPLACEMENTS, **PDF_LIGATURE_REPLACEMENTS})
+
+# Special LaTeX characters that need escaping in abstracts (unless already escaped)
+ABSTRACT_ESCAPE_RE = re.compile(r'(?<!\\)([%&])')
+
+# ID format - only exclude characters that would break BibTeX
+ID_RE = re.compile(r'^[^,{}\(\)="\#%~\\\s]+$')
+
+# LaTeX command (control word or control symbol) with any simple brace arguments
+LATEX_COMMAND_RE = re.compile(r'\\(?:[A-Za-z@]+\*?|.)(?:\s*\{[^{}\\]*\})*', re.DOTALL)
+LATEX_ARG_START_RE = re.compile(r'\s*\{')
+BRACE_TOKEN_RE = re.compile(r'\\.|[{}]', re.DOTALL)
+
+# Double quotes with the character on either side, and standalone single quotes
+DOUBLE_QUOTE_RE = re.compile(r'(^|.)"([^"]+)"($|.)')
+SINGLE_QUOTE_RE = re.compile(r"(?<!\w)'([^']+)'(?!\w)")
+
+# URL pattern matching https:// or http:// followed by valid URL characters
+URL_RE = re.compile(r'^https?://[^\s,]+$')
+
+REQUIRED_INPROCEEDINGS_FIELDS = ['title', 'author', 'pages', 'abstract']
+
+TEXT_FIELDS = ['title', 'abstract', 'author', 'editor']
+
+# Number of entries from which text fixing is spread over worker processes
+PARALLEL_THRESHOLD = 2000
+
+# Define field ordering priority
+PROCEEDINGS_ORDER = [
+    'booktitle',
+    'name',
+    'shortname',
+    'year',
+    'editor',
+    'volume',
+    'start',
+    'end',
+    'published',
+    'address',
+    'conference_url',
+    'conference_number'
+]
+
+INPROCEEDINGS_ORDER = [
+    'title',
+    'author',
+    'pages',
+    'abstract',
+    'section',      # optional fields
+    'openreview',
+    'software',
+    'video'
+]
+
+# Output position of each field, with ENTRYTYPE and ID always first
+PROCEEDINGS_RANK = {field: i for i, field in enumerate(['ENTRYTYPE', 'ID'] + PROCEEDINGS_ORDER)}
+INPROCEEDINGS_RANK = {field: i for i, field in enumerate(['ENTRYTYPE', 'ID'] + INPROCEEDINGS_ORDER)}
+
+def custom_entry_sort(entry):
+    """Return a copy of entry with its fields in PMLR order.
+
+    Fields not in the ordering keep their original relative order at the end.
+    """
+    if entry['ENTRYTYPE'] == PROCEEDINGS:
+        rank = PROCEEDINGS_RANK
+    else:  # InProceedings
+        rank = INPROCEEDINGS_RANK
+    unranked = len(rank)
+    return {key: entry[key] for key in sorted(entry, key=lambda key: rank.get(key, unranked))}
+
+def index_files_by_id(filenames):
+    """Map each possible entry ID to the filenames that belong to it.
+
+    A file belongs to an ID if it is named '<ID>.<ext>' or '<ID>-supp.<ext>'.
+    Since IDs may themselves contain dots, every dot in a filename is
+    considered as a possible end of the ID.
+    """
+    files_by_id = defaultdict(list)
+    for filename in filenames:
+        dot = filename.find('.')
+        while dot != -1:
+            prefix = filename[:dot]
+            files_by_id[prefix].append(filename)
+            if prefix.endswith('-supp'):
+                files_by_id[prefix[:-len('-supp')]].append(filename)
+            dot = filename.find('.', dot + 1)
+    return files_by_id
+
+def replace_unicode(text):
+    """Replace Unicode characters and PDF ligatures with their LaTeX/ASCII forms."""
+    # Every character in the table is non-ASCII, so ASCII text is already clean
+    if text.isascii():
+        return text
+    return text.translate(TEXT_TRANS)
+
+def fix_text_fields(entry):
+    """Fix PDF ligatures, Unicode and quotes in the text fields of an entry."""
+    for field in TEXT_FIELDS:
+        if field in entry:
+            text = entry[field]
+
+            # Normalize whitespace - collapse multiple spaces and newlines into single space
+            text = ' '.join(text.split())
+
+            # Handle Unicode replacements (excluding quotes) and PDF ligatures
+            text = replace_unicode(text)
+
+            # Handle quotes with more sophisticated logic, except in author/editor names
+            if field not in ('author', 'editor'):
+                text = replace_quotes(text)
+
+            # Handle special LaTeX escapes for abstract only
+            if field == 'abstract':
+                text = ABSTRACT_ESCAPE_RE.sub(r'\\\1', text)
+
+            entry[field] = text
+    return entry
+
+def fix_entries_text(entries, parallel=False):
+    """Apply fix_text_fields to every entry, in worker processes if parallel is set.
+
+    Workers are only started for large files. Returns the fixed entries in
+    order; with worker processes these are copies of the input entries
+    rather than the same objects.
+    """
+    workers = os.cpu_count() or 1
+    if not parallel or len(entries) < PARALLEL_THRESHOLD or workers < 2:
+        return [fix_text_fields(entry) for entry in entries]
+    chunksize = len(entries) // (4 * workers) + 1
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(fix_text_fields, entries, chunksize=chunksize))
+
+def get_unique_normalized_id(original_id, normalized_id, existing_ids, suffix_counters=None):
+    """Generate a unique normalized ID by adding a suffix if needed.
+
+    If given, suffix_counters is a Counter of the last suffix tried for each
+    base ID, so repeated clashes on the same base don't rescan the suffixes
+    already taken.
+    """
+    if suffix_counters is None:
+        suffix_counters = Counter()
     base_id = normalized_id
-    counter = 1
     while normalized_id in existing_ids:
-        normalized_id = f"{base_id}_{counter}"
-        counter += 1
+        suffix_counters[base_id] += 1
+        normalized_id = f"{base_id}_{suffix_counters[base_id]}"
     return normalized_id
 
-def check_and_fix_bibtex(input_file, output_file):
+def check_and_fix_bibtex(input_file, output_file, parallel=False):
+    """Validate input_file against the PMLR specification and write the fixed version to output_file.
+
+    With parallel=True, text fields of large files are fixed in worker
+    processes. Under the spawn start method (the default on macOS and
+    Windows) the calling script must then guard its entry point with
+    if __name__ == '__main__'.
+    """
     # Log start of processing
     logging.info(f"Starting to process {input_file}")
     
@@ -45,196 +359,26 @@ def check_and_fix_bibtex(input_file, output_file):
     parser.ignore_nonstandard_types = False
     
     # Read the BibTeX file
-    with open(input_file, 'r', encoding='utf-8') as bibtex_file:
-        bib_database = bibtexparser.load(bibtex_file, parser)
+    bib_database = load_bibtex(Path(input_file).read_text(encoding='utf-8'), parser)
     logging.info(f"Loaded {len(bib_database.entries)} entries from BibTeX file")
 
     proceedings_entries = []
     issues = []
 
-    # Unicode replacements (for all fields)
-    unicode_replacements = {
-        # German/Swedish/Finnish umlauts
-        'ä': '{\\"{a}}',
-        'ë': '{\\"{e}}',
-        'ï': '{\\"{i}}',
-        'ö': '{\\"{o}}',
-        'ü': '{\\"{u}}',
-        'ÿ': '{\\"{y}}',
-        'Ä': '{\\"{A}}',
-        'Ë': '{\\"{E}}',
-        'Ï': '{\\"{I}}',
-        'Ö': '{\\"{O}}',
-        'Ü': '{\\"{U}}',
-        'Ÿ': '{\\"{Y}}',
-        'ß': '{\\ss}',
-        
-        # Acute accents
-        'á': '{\\\'{a}}',
-        'é': '{\\\'{e}}',
-        'í': '{\\\'{i}}',
-        'ó': '{\\\'{o}}',
-        'ú': '{\\\'{u}}',
-        'ý': '{\\\'{y}}',
-        'Á': '{\\\'{A}}',
-        'É': '{\\\'{E}}',
-        'Í': '{\\\'{I}}',
-        'Ó': '{\\\'{O}}',
-        'Ú': '{\\\'{U}}',
-        'Ý': '{\\\'{Y}}',
-        
-        # Grave accents
-        'à': '{\\`{a}}',
-        'è': '{\\`{e}}',
-        'ì': '{\\`{i}}',
-        'ò': '{\\`{o}}',
-        'ù': '{\\`{u}}',
-        'À': '{\\`{A}}',
-        'È': '{\\`{E}}',
-        'Ì': '{\\`{I}}',
-        'Ò': '{\\`{O}}',
-        'Ù': '{\\`{U}}',
-        
-        # Circumflex
-        'â': '{\\^{a}}',
-        'ê': '{\\^{e}}',
-        'î': '{\\^{i}}',
-        'ô': '{\\^{o}}',
-        'û': '{\\^{u}}',
-        'Â': '{\\^{A}}',
-        'Ê': '{\\^{E}}',
-        'Î': '{\\^{I}}',
-        'Ô': '{\\^{O}}',
-        'Û': '{\\^{U}}',
-        
-        # Tilde
-        'ã': '{\\~{a}}',
-        'ñ': '{\\~{n}}',
-        'õ': '{\\~{o}}',
-        'Ã': '{\\~{A}}',
-        'Ñ': '{\\~{N}}',
-        'Õ': '{\\~{O}}',
-        
-        # Polish specific
-        'ą': '\\k{a}',
-        'ę': '\\k{e}',
-        'ć': "\\'c",
-        'ł': '\\l{}',
-        'ń': "\\'n",
-        'ś': "\\'s",
-        'ź': "\\'z",
-        'ż': '\\.z',
-        'Ą': '\\k{A}',
-        'Ę': '\\k{E}',
-        'Ć': "\\'C",
-        'Ł': '\\L{}',
-        'Ń': "\\'N",
-        'Ś': "\\'S",
-        'Ź': "\\'Z",
-        'Ż': '\\.Z',
-        
-        # Czech/Slovak specific
-        'ř': '\\v{r}',
-        'š': '\\v{s}',
-        'ť': '\\v{t}',
-        'ď': '\\v{d}',
-        'Ř': '\\v{R}',
-        'Š': '\\v{S}',
-        'Ť': '\\v{T}',
-        'Ď': '\\v{D}',
-        
-        # Danish/Norwegian specific
-        'ø': '\\o{}',
-        'å': '\\aa{}',
-        'Ø': '\\O{}',
-        'Å': '\\AA{}',
-        
-        # Various quotation marks and dashes
-        '"': "``",    # left double quote
-        '"': "''",    # right double quote
-        "'": "`",     # left single quote
-        "'": "'",     # right single quote
-        '‚': ",",     # low single quote
-        '„': ",,",    # low double quote
-        '–': '--',    # en-dash
-        '—': '---',   # em-dash
-        
-        # Other special characters
-        'æ': '\\ae{}',
-        'Æ': '\\AE{}',
-        'œ': '\\oe{}',
-        'Œ': '\\OE{}',
-        'ß': '\\ss{}',
-        '¡': '!`',
-        '¿': '?`',
-        
-        # Greek letters
-        'λ': '\\lambda',
-        
-        # Additional characters found in corl24.bib
-        '\xa0': ' ',        # non-breaking space
-        'ç': '\\c{c}',      # c-cedilla
-        'ğ': '\\u{g}',      # g with breve
-        'ś': "\\'s",        # s-acute
-        'ć': "\\'c",        # c-acute
-        '≥': '$\\geq$',     # greater than or equal
-        'å': '\\aa{}',      # a with ring
-        'ø': '\\o{}',       # slashed o
-        '–': '--',          # en-dash
-        '—': '---',         # em-dash
-        '’': "'",           # right single quote
-        '\u201c': '``',          # left double quote (U+201C)
-        '\u201d': "''",          # right double quote (U+201D) 
-        
-        # Dashes - specify exact Unicode values
-        '\u2013': '--',    # en-dash (–)
-        '\u2014': '---',   # em-dash (—)
-        '\u2212': '-',     # minus sign (−)
-    }
-
-    # Special LaTeX characters that need escaping in abstracts
-    abstract_latex_escapes = {
-        '%': '\\%',
-        '&': '\\&',
-    }
-
-    # PDF ligature replacements (common combinations that get merged in PDFs)
-    pdf_ligature_replacements = {
-        'ﬁ': 'fi',
-        'ﬂ': 'fl',
-        'ﬀ': 'ff',
-        'ﬃ': 'ffi',
-        'ﬄ': 'ffl',
-        'ﬅ': 'ft',
-        'ﬆ': 'st',
-        'Ꜳ': 'AA',
-        'ꜳ': 'aa',
-        'Ꜵ': 'AO',
-        'ꜵ': 'ao',
-        'Ꜷ': 'AU',
-        'ꜷ': 'au',
-        'Ꜹ': 'AV',
-        'ꜹ': 'av',
-        'Ꜻ': 'AY',
-        'ꜻ': 'ay',
-        'Ꜽ': 'OO',
-        'ꜽ': 'oo'
-    }
-    
     # Check proceedings entry
     logging.debug("Starting proceedings entry check")
     proceedings_entries = []
     
     for entry in bib_database.entries:
-        # Normalize entry type to title case (Proceedings, InProceedings)
-        entry['ENTRYTYPE'] = entry['ENTRYTYPE'].title()
-        logging.debug(f"Checking entry type: {entry.get('ENTRYTYPE')} with ID: {entry.get('ID')}")
+        # Normalize entry type to title case (Proceedings, Inproceedings)
+        entry['ENTRYTYPE'] = sys.intern(entry['ENTRYTYPE'].title())
+        logging.debug("Checking entry type: %s with ID: %s", entry.get('ENTRYTYPE'), entry.get('ID'))
         
-        if entry['ENTRYTYPE'] == 'Proceedings':
+        if entry['ENTRYTYPE'] == PROCEEDINGS:
             logging.info(f"Found proceedings entry with ID: {entry.get('ID')}")
             proceedings_entries.append(entry)
             # Check required fields immediately for each proceedings entry
-            missing_fields = REQUIRED_PROCEEDINGS_FIELDS - set(entry.keys())
+            missing_fields = REQUIRED_PROCEEDINGS_FIELDS.difference(entry)
             if missing_fields:
                 msg = f"Missing required field(s) in Proceedings: {', '.join(missing_fields)}"
                 logging.error(msg)
@@ -248,29 +392,30 @@ def check_and_fix_bibtex(input_file, output_file):
 
     # Check and fix InProceedings entries
     existing_ids = set()  # Track all IDs we've seen
+    id_suffixes = Counter()  # Last suffix tried for each clashing normalized ID
     id_changes = {}  # Store original -> normalized ID mappings
 
     for entry in bib_database.entries:
-        if entry['ENTRYTYPE'].lower() == 'inproceedings':  # Make case-insensitive
+        if entry['ENTRYTYPE'] == INPROCEEDINGS:  # Case-insensitive, as types are title-cased above
             # Check required fields
-            required_fields = ['title', 'author', 'pages', 'abstract']
-            for field in required_fields:
+            for field in REQUIRED_INPROCEEDINGS_FIELDS:
                 if field not in entry or not entry[field]:
                     issues.append(f"Missing or empty required field '{field}' in entry {entry.get('ID', 'unknown')}")
 
             # Normalize ID if it contains Unicode characters
-            if any(ord(c) > 127 for c in entry['ID']):
+            if not entry['ID'].isascii():
                 original_id = entry['ID']
                 # First replace ß with ss
                 normalized_id = entry['ID'].replace('ß', 'ss')
                 # Then convert remaining Unicode to closest ASCII representation
                 normalized_id = unicodedata.normalize('NFKD', normalized_id)
-                normalized_id = ''.join(c for c in normalized_id if ord(c) < 128)
+                normalized_id = normalized_id.encode('ascii', 'ignore').decode('ascii')
                 
                 if normalized_id != original_id:
                     # Check for clashes and get unique ID
                     if normalized_id in existing_ids:
-                        normalized_id = get_unique_normalized_id(original_id, normalized_id, existing_ids)
+                        normalized_id = get_unique_normalized_id(
+                            original_id, normalized_id, existing_ids, id_suffixes)
                         logging.warning(f"ID clash detected. '{original_id}' normalized to '{normalized_id}' to avoid duplicate")
                     
                     id_changes[original_id] = normalized_id
@@ -280,151 +425,32 @@ def check_and_fix_bibtex(input_file, output_file):
             existing_ids.add(entry['ID'])
 
             # Check ID format - only exclude characters that would break BibTeX
-            if not re.match(r'^[^,{}\(\)="\#%~\\\s]+$', entry.get('ID', '')):
+            if not ID_RE.match(entry.get('ID', '')):
                 issues.append(f"Invalid ID format (contains illegal characters): {entry.get('ID', 'unknown')}")
 
             # Check software field format if present
             if 'software' in entry and entry['software']:
-                # URL pattern matching https:// or http:// followed by valid URL characters
-                if not re.match(r'^https?://[^\s,]+$', entry['software'].strip()):
+                if not URL_RE.match(entry['software'].strip()):
                     issues.append(f"Software field should contain a single valid URL in entry {entry.get('ID', 'unknown')}")
 
-            # Fix PDF ligatures and Unicode in all text fields
-            text_fields = ['title', 'abstract', 'author', 'editor']
-            for field in text_fields:
-                if field in entry:
-                    # Handle author/editor fields which might be lists or strings
-                    if field in ['author', 'editor'] and entry[field]:
-                        # Split authors/editors if they're in a string format
-                        if isinstance(entry[field], str):
-                            # Normalize whitespace first - collapse multiple spaces and newlines into single space
-                            normalized_text = ' '.join(entry[field].split())
-                            authors = [name.strip() for name in normalized_text.split(' and ')]
-                        else:
-                            authors = entry[field]
-                        
-                        # Process each author/editor name
-                        processed_authors = []
-                        for author in authors:
-                            # First handle Unicode replacements
-                            for char, replacement in unicode_replacements.items():
-                                if char not in ['"', '"', ''', ''']:  # Skip quote replacements
-                                    author = author.replace(char, replacement)
-                            
-                            # Then handle PDF ligatures
-                            for ligature, replacement in pdf_ligature_replacements.items():
-                                author = author.replace(ligature, replacement)
-                            
-                            # Finally handle quotes, but not within LaTeX commands
-                            for char, replacement in {'"': "``", '"': "''", ''': "`", ''': "'"}.items():
-                                # Don't replace quotes that are part of LaTeX commands (after backslash)
-                                parts = author.split('\\')
-                                new_parts = [parts[0]]  # First part (no backslash)
-                                for part in parts[1:]:  # Parts after backslashes
-                                    new_parts.append('\\' + part)  # Keep original backslash and part
-                                author = ''.join(new_parts)
-                                
-                            processed_authors.append(author)
-                        
-                        # Rejoin the authors/editors
-                        entry[field] = ' and '.join(processed_authors)
-                    else:
-                        # For other fields (title, abstract), process in the same way
-                        text = entry[field]
-                        
-                        # Normalize whitespace - collapse multiple spaces and newlines into single space
-                        text = ' '.join(text.split())
-                        
-                        # First handle Unicode replacements (excluding quotes)
-                        for char, replacement in unicode_replacements.items():
-                            if char not in ['"', '"', ''', ''']:  # Skip quote replacements
-                                text = text.replace(char, replacement)
-                        
-                        # Then handle PDF ligatures
-                        for ligature, replacement in pdf_ligature_replacements.items():
-                            text = text.replace(ligature, replacement)
-                        
-                        # Handle quotes with more sophisticated logic
-                        text = replace_quotes(text)
-                        
-                        entry[field] = text
-
-                    # Handle special LaTeX escapes for abstract only
-                    if field == 'abstract':
-                        for char, replacement in abstract_latex_escapes.items():
-                            entry[field] = re.sub(
-                                r'(?<!\\)' + re.escape(char),
-                                replacement,
-                                entry[field]
-                            )
-
-    # Define field ordering priority
-    proceedings_order = [
-        'booktitle',
-        'name',
-        'shortname',
-        'year',
-        'editor',
-        'volume',
-        'start',
-        'end',
-        'published',
-        'address',
-        'conference_url',
-        'conference_number'
-    ]
-
-    inproceedings_order = [
-        'title',
-        'author',
-        'pages',
-        'abstract',
-        'section',      # optional fields
-        'openreview',
-        'software',
-        'video'
-    ]
+    # Fix PDF ligatures and Unicode in all text fields
+    entries = bib_database.entries
+    to_fix = [i for i, entry in enumerate(entries) if entry['ENTRYTYPE'] == INPROCEEDINGS]
+    for i, entry in zip(to_fix, fix_entries_text([entries[i] for i in to_fix], parallel)):
+        entries[i] = entry
 
     # Set up writer with custom ordering
     writer = BibTexWriter()
     writer.indent = '    '
     writer.order_entries_by = None  # Disable entry ordering
-    writer.display_order = ['ENTRYTYPE', 'ID'] + proceedings_order + inproceedings_order  # Set field display order
+    writer.display_order = ['ENTRYTYPE', 'ID'] + PROCEEDINGS_ORDER + INPROCEEDINGS_ORDER  # Set field display order
     writer._entry_separator = '\n\n'  # Add blank line between entries
 
-    def custom_entry_sort(entry):
-        if entry['ENTRYTYPE'] == 'Proceedings':
-            field_order = proceedings_order
-        else:  # InProceedings
-            field_order = inproceedings_order
-        
-        # Create ordered dict with fields in specified order
-        ordered_entry = {}
-        # First add ENTRYTYPE and ID
-        ordered_entry['ENTRYTYPE'] = entry['ENTRYTYPE']
-        ordered_entry['ID'] = entry['ID']
-        # Then add other fields in specified order
-        for field in field_order:
-            if field in entry:
-                ordered_entry[field] = entry[field]
-        # Add any remaining fields
-        for key, value in entry.items():
-            if key not in ordered_entry:
-                ordered_entry[key] = value
-        
-        return ordered_entry
-
     # Apply ordering to entries
-    for entry in bib_database.entries:
-        # Store the entry data before clearing
-        entry_data = dict(entry)
-        # Clear and update with ordered data
-        entry.clear()
-        entry.update(custom_entry_sort(entry_data))
+    bib_database.entries = [custom_entry_sort(entry) for entry in bib_database.entries]
 
     # Write fixed BibTeX
-    with open(output_file, 'w', encoding='utf-8') as bibtex_file:
-        bibtexparser.dump(bib_database, bibtex_file, writer)
+    Path(output_file).write_text(writer.write(bib_database), encoding='utf-8')
 
     # Print issues
     if issues:
@@ -439,19 +465,18 @@ def check_and_fix_bibtex(input_file, output_file):
     if id_changes:
         logging.info("\nChecking for associated files to rename...")
         directory = os.path.dirname(input_file) if os.path.dirname(input_file) else '.'
+        # Scan the directory once and index the files by the ID they belong to
+        files_by_id = index_files_by_id(os.listdir(directory))
         
         for original_id, new_id in id_changes.items():
             # Find all files matching the original ID pattern
             files_to_rename = []
-            for filename in os.listdir(directory):
-                # Match both direct files and supplementary files
-                if (filename.startswith(original_id + '.') or 
-                    filename.startswith(original_id + '-supp.')):
-                    old_path = os.path.join(directory, filename)
-                    # Replace only the ID portion of the filename
-                    new_filename = filename.replace(original_id, new_id, 1)
-                    new_path = os.path.join(directory, new_filename)
-                    files_to_rename.append((old_path, new_path))
+            for filename in files_by_id.get(original_id, []):
+                old_path = os.path.join(directory, filename)
+                # Replace only the ID portion of the filename
+                new_filename = filename.replace(original_id, new_id, 1)
+                new_path = os.path.join(directory, new_filename)
+                files_to_rename.append((old_path, new_path))
             
             if files_to_rename:
                 # Check for any destination conflicts
@@ -486,91 +511,60 @@ def check_and_fix_bibtex(input_file, output_file):
                 logging.info(f"No files found matching '{original_id}.*' or '{original_id}-supp.*'")
 
 def replace_quotes(text):
-    """Process quotes in text, handling various edge cases."""
-    # First split text into parts: regular text and LaTeX commands
+    """Process quotes in text, leaving LaTeX commands and their arguments unchanged."""
     parts = []
     current = 0
-    in_command = False
-    command_start = 0
-    
-    # Iterate through text to identify LaTeX commands (starting with \)
-    for i, char in enumerate(text):
-        if char == '\\' and not in_command:
-            # Check if backslash is escaped
-            if i > 0 and text[i-1] == '\\':
-                continue
-                
-            # When we find a command, process any text before it
-            if current < i:
-                parts.append(process_quotes_in_text(text[current:i]))
-            command_start = i
-            in_command = True
-        elif in_command and char == '{':
-            # Found opening brace of command argument
-            # Count braces to find matching closing brace
-            brace_count = 1
-            j = i + 1
-            while j < len(text) and brace_count > 0:
-                if text[j] == '{' and (j == 0 or text[j-1] != '\\'):
-                    brace_count += 1
-                elif text[j] == '}' and (j == 0 or text[j-1] != '\\'):
-                    brace_count -= 1
-                j += 1
-            if brace_count == 0:
-                # Found complete command - add it unchanged
-                parts.append(text[command_start:j])
-                current = j
-                in_command = False
-            else:
+    brace_groups = None
+
+    for match in LATEX_COMMAND_RE.finditer(text):
+        start, end = match.span()
+        if start < current:
+            # Inside the nested arguments of the previous command
+            continue
+        # Arguments nested deeper than the pattern handles are matched by brace counting
+        while (arg := LATEX_ARG_START_RE.match(text, end)) is not None:
+            if brace_groups is None:
+                brace_groups = match_brace_groups(text)
+            arg_end = brace_groups.get(arg.end() - 1)
+            if arg_end is None:
                 # No matching brace - treat as normal text
-                in_command = False
-                
+                break
+            end = arg_end
+
+        # Process the text before the command, then add the command unchanged
+        if current < start:
+            parts.append(process_quotes_in_text(text[current:start]))
+        parts.append(text[start:end])
+        current = end
+
     # Add any remaining text after last command
     if current < len(text):
         parts.append(process_quotes_in_text(text[current:]))
-    
+
     return ''.join(parts)
 
+def match_brace_groups(text):
+    """Map the index of each matched '{' in text to the index just past its '}'.
+
+    Braces are paired in a single pass, so unmatched ones cost nothing extra.
+    """
+    groups = {}
+    open_braces = []
+    for token in BRACE_TOKEN_RE.finditer(text):
+        if token.group() == '{':
+            open_braces.append(token.start())
+        elif token.group() == '}' and open_braces:
+            groups[open_braces.pop()] = token.end()
+    return groups
+
 def process_quotes_in_text(text):
     """Process quotes in regular text (not in LaTeX commands)."""
-    parts = []
-    current = 0
-    
-    # First handle double quotes
-    quote_pattern = r'(^|.)"([^"]+)"(?:$|.)'
-    
-    for match in re.finditer(quote_pattern, text):
-        # Add text before this match
-        start = match.start(1)  # Start from the character before quote
-        if current < start:
-            parts.append(text[current:start])
-        
-        before = match.group(1)
-        content = match.group(2)
-        after = match.string[match.end()-1] if match.end() < len(match.string) else ''
-        
-        # Add the character before quote if it exists and isn't start of string
-        if before and before != '^':
-            parts.append(before)
-            
-        # Add quoted content with PROTECTED closing quotes
-        parts.append(f"``{content}###CLOSING###")
-        
-        # Add the character after quote if it exists and isn't end of string
-        if after and after != '$':
-            parts.append(after)
-        
-        current = match.end() if after else match.end() - 1
-    
-    # Add remaining text
-    if current < len(text):
-        parts.append(text[current:])
-    
-    # Join the parts
-    result = ''.join(parts)
+    # First handle double quotes, keeping the characters around them and
+    # PROTECTING the closing quotes from the single quote pass
+    result = DOUBLE_QUOTE_RE.sub(r"\1``\2###CLOSING###\3", text)
     
     # Handle single quotes
-    result = re.sub(r"(?<!\w)'([^']+)'(?!\w)", r"`\1'", result)
+    result = SINGLE_QUOTE_RE.sub(r"`\1'", result)
     
     # Replace protected closing quotes
     result = result.replace("###CLOSING###", "''")
@@ -0,0 +1,138 @@
+import logging
+import re
+
+import bibtexparser
+from bibtexparser.bibtexexpression import strip_after_new_lines
+
+# Whitespace skipped by bibtexparser's grammar between tokens
+WHITESPACE_RE = re.compile(r'[ \t\r\n]*')
+
+# @EntryType followed by the opening brace
+ENTRY_START_RE = re.compile(r'@[ \t\r\n]*([A-Za-z]+)[ \t\r\n]*\{')
+
+# field_name = (opening of the value)
+FIELD_START_RE = re.compile(r'[ \t\r\n]*([A-Za-z0-9_\-().+]+)[ \t\r\n]*=[ \t\r\n]*')
+
+INTEGER_RE = re.compile(r'[0-9]+')
+BRACE_RE = re.compile(r'[{}]')
+QUOTED_TOKEN_RE = re.compile(r'["{}]')
+
+# Declarations that are not plain entries and are left to bibtexparser
+SPECIAL_TYPES = {'string', 'preamble', 'comment'}
+
+
+class UnsupportedSyntax(Exception):
+    """Raised when the input uses BibTeX syntax the fast path doesn't handle."""
+
+
+def load_bibtex(text, parser):
+    """Parse a BibTeX string into parser's database.
+
+    Files made only of plain entries with braced, quoted or integer values are
+    split with a few regexes, and each entry is then handed to the parser's
+    own cleaning step, so the database is the same one bibtexparser would
+    build. Anything else (comments, @string macros, # concatenation, parse
+    errors) is parsed by bibtexparser itself.
+    """
+    try:
+        entries = split_entries(text)
+    except UnsupportedSyntax as e:
+        logging.debug("Using bibtexparser for the whole file: %s", e)
+        return bibtexparser.loads(text, parser)
+
+    for entry_type, key, fields in entries:
+        parser._add_entry(entry_type, key, fields)
+    if parser.add_missing_from_crossref:
+        parser.bib_database.add_missing_from_crossref()
+    return parser.bib_database
+
+
+def split_entries(text):
+    """Split text into (entry type, key, fields) tuples.
+
+    Raises UnsupportedSyntax for anything but whitespace-separated entries.
+    """
+    if text.startswith('\ufeff'):
+        text = text[1:]
+    # pyparsing expands tabs before parsing, which shows up in multi-line values
+    text = text.expandtabs()
+
+    entries = []
+    pos = WHITESPACE_RE.match(text).end()
+    while pos < len(text):
+        match = ENTRY_START_RE.match(text, pos)
+        if match is None:
+            raise UnsupportedSyntax(f"text outside of an entry at offset {pos}")
+        entry_type = match.group(1)
+        if entry_type.lower() in SPECIAL_TYPES:
+            raise UnsupportedSyntax(f"@{entry_type} declaration")
+
+        # Entry key: everything up to the first comma, without whitespace
+        comma = text.find(',', match.end())
+        if comma == -1:
+            raise UnsupportedSyntax(f"entry without fields at offset {pos}")
+        key = text[match.end():comma].strip()
+        if not key or any(c.isspace() for c in key):
+            raise UnsupportedSyntax(f"invalid entry key {key!r}")
+
+        fields, pos = split_fields(text, comma + 1)
+        entries.append((entry_type, key, fields))
+        pos = WHITESPACE_RE.match(text, pos).end()
+    return entries
+
+
+def split_fields(text, pos):
+    """Parse 'name = value' pairs up to the closing brace of an entry.
+
+    Returns the fields dict (built like bibtexparser's, so the first of any
+    duplicated field wins) and the offset just past the entry.
+    """
+    pairs = []
+    while True:
+        match = FIELD_START_RE.match(text, pos)
+        if match is None:
+            if not pairs:
+                raise UnsupportedSyntax(f"entry without fields at offset {pos}")
+            break
+        value, pos = split_value(text, match.end())
+        pairs.append((match.group(1), strip_after_new_lines(value)))
+
+        pos = WHITESPACE_RE.match(text, pos).end()
+        if not text.startswith(',', pos):
+            break
+        pos += 1
+
+    pos = WHITESPACE_RE.match(text, pos).end()
+    if not text.startswith('}', pos):
+        raise UnsupportedSyntax(f"unexpected text in entry at offset {pos}")
+    return {name: value for name, value in reversed(pairs)}, pos + 1
+
+
+def split_value(text, pos):
+    """Return a field value without its delimiters and the offset past it."""
+    if text.startswith('{', pos):
+        depth = 0
+        for token in BRACE_RE.finditer(text, pos):
+            depth += 1 if token.group() == '{' else -1
+            if depth == 0:
+                return text[pos + 1:token.start()], token.end()
+        raise UnsupportedSyntax(f"unbalanced braces at offset {pos}")
+
+    if text.startswith('"', pos):
+        depth = 0
+        for token in QUOTED_TOKEN_RE.finditer(text, pos + 1):
+            char = token.group()
+            if char == '"' and depth == 0:
+                return text[pos + 1:token.start()], token.end()
+            if char == '{':
+                depth += 1
+            elif char == '}':
+                if depth == 0:
+                    raise UnsupportedSyntax(f"unbalanced braces at offset {pos}")
+                depth -= 1
+        raise UnsupportedSyntax(f"unterminated quoted value at offset {pos}")
+
+    match = INTEGER_RE.match(text, pos)
+    if match is None:
+        raise UnsupportedSyntax(f"string macro or expression at offset {pos}")
+    return match.group(), match.end()
@@ -1,9 +1,37 @@
 import pytest
+import re
 from pmlrpy import check_and_fix_bibtex
+from pmlrpy import core
+from pmlrpy.loader import load_bibtex
 import bibtexparser
 from bibtexparser.bparser import BibTexParser
-import os
 from pathlib import Path
+from types import SimpleNamespace
+
+NON_ASCII_RE = re.compile(r'[^\x00-\x7f]')
+
+# Expected quote replacements in test_quote_handling_with_brackets
+BRACKET_NEEDLES = (
+    '``[Bracketed] Title\'\'',  # Quotes around entire bracketed title
+    '``[quoted] brackets\'\'',  # Quotes around word with brackets after
+    '``(quoted) parens\'\'',  # Quotes around word with parens after
+    '``{quoted} braces\'\'',  # Quotes around word with braces after
+    '``string start\'\'',  # Quotes at start of string
+    '``string end\'\'',  # Quotes at end of string
+    '``quoted\'\' words in ``one string\'\'',  # Multiple quotes in one string
+    '[(``quoted\'\')]',  # Nested quotes within brackets
+)
+BRACKET_RE = re.compile('|'.join(
+    re.escape(needle) for needle in sorted(BRACKET_NEEDLES, key=len, reverse=True)))
+
+def make_parser():
+    """Returns a BibTexParser configured the same way for every test"""
+    return BibTexParser(common_strings=True)
+
+@pytest.fixture
+def parser():
+    # Parsers collect entries in their bib_database, so each test gets its own
+    return make_parser()
 
 @pytest.fixture
 def test_bib_file(tmp_path):
@@ -13,17 +41,33 @@ def test_bib_file(tmp_path):
     input_file.write_text(test_content, encoding='utf-8')
     return str(input_file)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def fixed_test_entries(tmp_path_factory):
+    """Runs check_and_fix_bibtex on test-entries.bib once and shares the result"""
+    output_file = tmp_path_factory.mktemp("fixed") / "test-entries_fixed.bib"
+    check_and_fix_bibtex('test/test-entries.bib', str(output_file))
+    content = output_file.read_text(encoding='utf-8')
+    db = bibtexparser.loads(content, make_parser())
+    return SimpleNamespace(path=output_file, content=content, db=db,
+                           by_id={e['ID']: e for e in db.entries})
+
+@pytest.fixture(scope="session")
+def original_test_entries():
+    """Parses the unfixed test-entries.bib once per session with bibtexparser"""
+    db = bibtexparser.loads(Path('test/test-entries.bib').read_text(encoding='utf-8'), make_parser())
+    return SimpleNamespace(db=db, by_id={e['ID']: e for e in db.entries})
+
+@pytest.fixture(scope="session")
 def base_proceedings():
     """Returns a standard proceedings entry required for all tests"""
     return Path('test/test-entries.bib').read_text(encoding='utf-8').split('\n\n')[0] + '\n\n'
 
+@pytest.mark.slow
 def test_unicode_replacement(test_bib_file, tmp_path):
     output_file = str(tmp_path / "test_fixed.bib")
     
     # Combine proceedings with test content
-    with open(test_bib_file, 'r', encoding='utf-8') as f:
-        test_content = f.read()
+    test_content = Path(test_bib_file).read_text(encoding='utf-8')
     
     combined_content = test_content
     input_file = tmp_path / "combined.bib"
@@ -32,8 +76,7 @@ def test_unicode_replacement(test_bib_file, tmp_path):
     check_and_fix_bibtex(str(input_file), output_file)
     
     # Read the output file
-    with open(output_file, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = Path(output_file).read_text(encoding='utf-8')
     
     # Check specific replacements
     assert '\\lambda' in content     # λ should be replaced
@@ -41,21 +84,12 @@ def test_unicode_replacement(test_bib_file, tmp_path):
     assert 'fl' in content          # ﬂ ligature should be replaced
     assert '\\"{u}' in content      # ü should be replaced with properly escaped and braced version
 
-def test_real_test_entries_file(tmp_path):
-    output_file = str(tmp_path / "test-entries_fixed.bib")
-    
-    # Process the input file
-    check_and_fix_bibtex('test/test-entries.bib', output_file)
-    
-    # Read the processed output file
-    with open(output_file, 'r', encoding='utf-8') as f:
-        content = f.read()
+@pytest.mark.slow
+def test_real_test_entries_file(fixed_test_entries):
+    content = fixed_test_entries.content
     
     # Find any remaining unicode characters
-    unicode_chars = set()
-    for char in content:
-        if ord(char) > 127:  # Non-ASCII characters
-            unicode_chars.add(char)
+    unicode_chars = set() if content.isascii() else set(NON_ASCII_RE.findall(content))
     
     if unicode_chars:
         print("\nFound unicode characters in processed output file:")
@@ -64,23 +98,19 @@ def test_real_test_entries_file(tmp_path):
     
     assert not unicode_chars, "Found unexpected unicode characters in processed output"
 
-def test_specific_entries():
+@pytest.mark.slow
+def test_specific_entries(original_test_entries):
     # Test specific entries we know have issues
-    parser = bibtexparser.bparser.BibTexParser()
-    
-    with open('test/test-entries.bib', 'r', encoding='utf-8') as f:
-        db = bibtexparser.load(f, parser)
-    
     # Check specific entries we saw in the snippets
     entries_to_check = ['goko24', 'murray24', 'ko24a']
     
     issues_found = []
     for entry_id in entries_to_check:
-        entry = next((e for e in db.entries if e['ID'] == entry_id), None)
+        entry = original_test_entries.by_id.get(entry_id)
         if entry:
             for field, value in entry.items():
-                if isinstance(value, str):
-                    unicode_chars = [c for c in value if ord(c) > 127]
+                if isinstance(value, str) and not value.isascii():
+                    unicode_chars = NON_ASCII_RE.findall(value)
                     if unicode_chars:
                         issues_found.append(f"Entry {entry_id}, field {field} contains unicode: {''.join(unicode_chars)}")
     
@@ -91,9 +121,8 @@ def test_specific_entries():
         
     assert not issues_found, "Found unicode characters in specific entries" 
 
-@pytest.fixture
-def complex_test_bib(tmp_path):
-    test_content = '''@Inproceedings{el-agroudi24,
+# Entry with multi-line fields and a non-ASCII author name
+BIB_COMPLEX = '''@Inproceedings{el-agroudi24,
     title = {In-Flight Attitude Control of a Quadruped using Deep
 Reinforcement Learning},
     author = {El-Agroudi, Tarek and Maurer, Finn Gross and Olsen,
@@ -121,17 +150,15 @@ second during large attitude reference steps.},
 https://github.com/ntnu-arl/Eurepus-design},
     video = {https://www.youtube.com/watch?v=5qNPCH34M2M&t=1s}
 }'''
+
+@pytest.fixture
+def complex_test_bib(tmp_path):
     input_file = tmp_path / "complex_test.bib"
-    input_file.write_text(test_content, encoding='utf-8')
+    input_file.write_text(BIB_COMPLEX, encoding='utf-8')
     return str(input_file)
 
-def test_complex_entry(tmp_path, caplog, base_proceedings):
-    input_file = tmp_path / "test.bib"
-    output_file = tmp_path / "test_fixed.bib"
-    
-    # Write test entry to file with proceedings
-    with open(input_file, "w") as f:
-        f.write(base_proceedings + """@InProceedings{el-agroudi24,
+# The same entry as BIB_COMPLEX, formatted with tab-aligned fields
+BIB_COMPLEX_TABBED = """@InProceedings{el-agroudi24,
   title =	 {In-Flight Attitude Control of a Quadruped using Deep
                    Reinforcement Learning},
   section =	 {Poster},
@@ -147,15 +174,20 @@ def test_complex_entry(tmp_path, caplog, base_proceedings):
   software =	 {https://github.com/ntnu-arl/Eurepus-RL and
                    https://github.com/ntnu-arl/Eurepus-design},
   video =	 {https://www.youtube.com/watch?v=5qNPCH34M2M&t=1s},
-}""")
+}"""
+
+def test_complex_entry(tmp_path, caplog, base_proceedings, parser):
+    input_file = tmp_path / "test.bib"
+    output_file = tmp_path / "test_fixed.bib"
+    
+    # Write test entry to file with proceedings
+    input_file.write_text(base_proceedings + BIB_COMPLEX_TABBED, encoding='utf-8')
 
     # Process the file
     check_and_fix_bibtex(input_file, output_file)
 
     # Read and parse the output file
-    with open(output_file) as f:
-        parser = BibTexParser()
-        bib_database = bibtexparser.load(f, parser)
+    bib_database = bibtexparser.loads(Path(output_file).read_text(encoding='utf-8'), parser)
 
     # Check that we got exactly one entry
     assert len(bib_database.entries) == 2
@@ -171,25 +203,24 @@ def test_complex_entry(tmp_path, caplog, base_proceedings):
     assert entry['pages'] == '5014-5029'
     assert 'J\\o{}rgen' in entry['author']  # Check that special character was preserved 
 
-def test_issues():
-    # Process the file
-    check_and_fix_bibtex('test/test-entries.bib', 'test/test-entries_fixed.bib')
-
-    # Read and parse the output file
-    with open('test/test-entries_fixed.bib') as f:
-        parser = BibTexParser()
-        bib_database = bibtexparser.load(f, parser)
-
+@pytest.mark.slow
+def test_issues(fixed_test_entries):
     # Find the specific entry
-    entry = next(e for e in bib_database.entries if e['ID'] == 'el-agroudi24')
+    entry = fixed_test_entries.by_id['el-agroudi24']
     
     # Verify fields
     assert entry['ENTRYTYPE'] == 'inproceedings'
     assert entry['pages'] == '5014-5029'
     assert 'J\\o{}rgen' in entry['author']
-    
-    # Clean up
-    os.remove('test/test-entries_fixed.bib') 
+
+# Proceedings entry missing some required fields
+BIB_INCOMPLETE_PROCEEDINGS = """@Proceedings{corl2024,
+  booktitle = {Conference on Robot Learning},
+  name = {Conference on Robot Learning},
+  year = {2024},
+  editor = {Some Editor},
+  volume = {1}
+}"""
 
 def test_proceedings_entry(tmp_path):
     """Test validation of Proceedings entry fields"""
@@ -197,14 +228,7 @@ def test_proceedings_entry(tmp_path):
     output_file = tmp_path / "test_fixed.bib"
     
     # Create a proceedings entry missing some required fields
-    with open(input_file, "w") as f:
-        f.write("""@Proceedings{corl2024,
-  booktitle = {Conference on Robot Learning},
-  name = {Conference on Robot Learning},
-  year = {2024},
-  editor = {Some Editor},
-  volume = {1}
-}""")
+    input_file.write_text(BIB_INCOMPLETE_PROCEEDINGS, encoding='utf-8')
 
     # Process the file and capture logs
     with pytest.raises(ValueError) as exc_info:
@@ -213,14 +237,8 @@ def test_proceedings_entry(tmp_path):
     # Verify that the error message mentions missing fields
     assert "Missing required field(s) in Proceedings" in str(exc_info.value)
 
-def test_id_normalization(tmp_path, base_proceedings):
-    """Test normalization of entry IDs containing Unicode characters"""
-    input_file = tmp_path / "test.bib"
-    output_file = tmp_path / "test_fixed.bib"
-    
-    # Create entries with Unicode IDs
-    with open(input_file, "w") as f:
-        f.write(base_proceedings + """@InProceedings{müller24,
+# Entries with Unicode IDs
+BIB_UNICODE_IDS = """@InProceedings{müller24,
   title = {Test Title},
   author = {Test Author},
   pages = {1-10},
@@ -232,50 +250,54 @@ def test_id_normalization(tmp_path, base_proceedings):
   author = {Another Author},
   pages = {11-20},
   abstract = {Another abstract}
-}""")
+}"""
+
+def test_id_normalization(tmp_path, base_proceedings, parser):
+    """Test normalization of entry IDs containing Unicode characters"""
+    input_file = tmp_path / "test.bib"
+    output_file = tmp_path / "test_fixed.bib"
+    
+    # Create entries with Unicode IDs
+    input_file.write_text(base_proceedings + BIB_UNICODE_IDS, encoding='utf-8')
 
     check_and_fix_bibtex(str(input_file), str(output_file))
     
     # Read the output and verify ID normalization
-    with open(output_file) as f:
-        parser = BibTexParser()
-        bib_database = bibtexparser.load(f, parser)
+    bib_database = bibtexparser.loads(Path(output_file).read_text(encoding='utf-8'), parser)
     
     ids = [entry['ID'] for entry in bib_database.entries]
     assert 'muller24' in ids
     assert 'grosse24' in ids
 
+# Entry with double and single quotes, including inside a LaTeX command
+BIB_QUOTES = """@InProceedings{test24,
+  title = {Test with "smart quotes" and 'single quotes'},
+  author = {Test Author},
+  pages = {1-10},
+  abstract = {Testing "quotes" within text and within \\command{"quoted"}. Also 'single' quotes.}
+}"""
+
 def test_quote_handling(tmp_path, base_proceedings):
     """Test proper handling of different types of quotes"""
     input_file = tmp_path / "test.bib"
     output_file = tmp_path / "test_fixed.bib"
     
-    with open(input_file, "w") as f:
-        f.write(base_proceedings + """@InProceedings{test24,
-  title = {Test with "smart quotes" and 'single quotes'},
-  author = {Test Author},
-  pages = {1-10},
-  abstract = {Testing "quotes" within text and within \\command{"quoted"}. Also 'single' quotes.}
-}""")
+    input_file.write_text(base_proceedings + BIB_QUOTES, encoding='utf-8')
 
     check_and_fix_bibtex(str(input_file), str(output_file))
     
-    with open(output_file) as f:
-        content = f.read()
+    content = Path(output_file).read_text(encoding='utf-8')
     
     # Check quote replacements
     assert '``smart quotes\'\'' in content
     assert '\\command{"quoted"}' in content  # Quotes in LaTeX commands should be preserved
     assert '`single\'' in content
 
-def test_field_ordering(tmp_path, base_proceedings):
-    """Test that fields are ordered correctly in the output"""
-    input_file = tmp_path / "test.bib"
-    output_file = tmp_path / "test_fixed.bib"
-    
-    # Create entry with fields in random order
-    with open(input_file, "w") as f:
-        f.write(base_proceedings + """@InProceedings{test24,
+# Fields whose relative order test_field_ordering checks
+FIELD_NAME_RE = re.compile(r'\b(title|author|pages|abstract)\s*=')
+
+# Entry with fields in random order
+BIB_UNORDERED_FIELDS = """@InProceedings{test24,
   video = {http://example.com},
   abstract = {Test abstract},
   author = {Test Author},
@@ -283,49 +305,50 @@ def test_field_ordering(tmp_path, base_proceedings):
   pages = {1-10},
   software = {http://example.com},
   section = {Poster}
-}""")
+}"""
+
+def test_field_ordering(tmp_path, base_proceedings):
+    """Test that fields are ordered correctly in the output"""
+    input_file = tmp_path / "test.bib"
+    output_file = tmp_path / "test_fixed.bib"
+    
+    # Create entry with fields in random order
+    input_file.write_text(base_proceedings + BIB_UNORDERED_FIELDS, encoding='utf-8')
 
     check_and_fix_bibtex(str(input_file), str(output_file))
     
-    with open(output_file) as f:
-        content = f.read()
+    content = Path(output_file).read_text(encoding='utf-8')
     
     # Check field order (title should come before author, etc.)
-    title_pos = content.find('title')
-    author_pos = content.find('author')
-    pages_pos = content.find('pages')
-    abstract_pos = content.find('abstract')
+    entry = content.split('@Inproceedings{test24,')[1]
+    order = [m.group(1) for m in FIELD_NAME_RE.finditer(entry)]
     
-    assert title_pos < author_pos < pages_pos < abstract_pos
+    assert order == ['title', 'author', 'pages', 'abstract']
+
+# Entry with unescaped LaTeX special characters in the abstract
+BIB_SPECIAL_CHARACTERS = """@InProceedings{test24,
+  title = {Test Title},
+  author = {Test Author},
+  pages = {1-10},
+  abstract = {Testing special characters: 100% accuracy & more}
+}"""
 
 def test_latex_escapes_in_abstract(tmp_path, base_proceedings):
     """Test that special LaTeX characters are properly escaped in abstracts"""
     input_file = tmp_path / "test.bib"
     output_file = tmp_path / "test_fixed.bib"
     
-    with open(input_file, "w") as f:
-        f.write(base_proceedings + """@InProceedings{test24,
-  title = {Test Title},
-  author = {Test Author},
-  pages = {1-10},
-  abstract = {Testing special characters: 100% accuracy & more}
-}""")
+    input_file.write_text(base_proceedings + BIB_SPECIAL_CHARACTERS, encoding='utf-8')
 
     check_and_fix_bibtex(str(input_file), str(output_file))
     
-    with open(output_file) as f:
-        content = f.read()
+    content = Path(output_file).read_text(encoding='utf-8')
     
     assert '100\\%' in content
     assert '\\&' in content 
 
-def test_quote_handling_with_brackets(tmp_path, base_proceedings):
-    """Test proper handling of quotes around brackets and at string boundaries"""
-    input_file = tmp_path / "test.bib"
-    output_file = tmp_path / "test_fixed.bib"
-    
-    with open(input_file, "w") as f:
-        f.write(base_proceedings + """@InProceedings{test24,
+# Entry with quotes around brackets and at string boundaries
+BIB_QUOTED_BRACKETS = """@InProceedings{test24,
   title = {"[Bracketed] Title"},
   author = {Test Author},
   pages = {1-10},
@@ -333,20 +356,122 @@ def test_quote_handling_with_brackets(tmp_path, base_proceedings):
              Also testing "string start" and "string end".
              Multiple "quoted" words in "one string".
              Nested [("quoted")] elements.}
-}""")
+}"""
+
+def test_quote_handling_with_brackets(tmp_path, base_proceedings):
+    """Test proper handling of quotes around brackets and at string boundaries"""
+    input_file = tmp_path / "test.bib"
+    output_file = tmp_path / "test_fixed.bib"
+    
+    input_file.write_text(base_proceedings + BIB_QUOTED_BRACKETS, encoding='utf-8')
 
     check_and_fix_bibtex(str(input_file), str(output_file))
     
-    with open(output_file) as f:
-        content = f.read()
-    # Display the content to the test console here for debugging
-    print(content)
+    content = Path(output_file).read_text(encoding='utf-8')
     # Check quote replacements in various contexts
-    assert '``[Bracketed] Title\'\'' in content  # Quotes around entire bracketed title
-    assert '``[quoted] brackets\'\'' in content    # Quotes around word with brackets after
-    assert '``(quoted) parens\'\'' in content     # Quotes around word with parens after
-    assert '``{quoted} braces\'\'' in content     # Quotes around word with braces after
-    assert '``string start\'\'' in content      # Quotes at start of string
-    assert '``string end\'\'' in content        # Quotes at end of string
-    assert '``quoted\'\' words in ``one string\'\'' in content  # Multiple quotes in one string
-    assert '[(``quoted\'\')]' in content            # Nested quotes within brackets 
\ No newline at end of file
+    found = set(BRACKET_RE.findall(content))
+    missing = set(BRACKET_NEEDLES) - found
+    assert not missing, missing
+
+# Entry with quotes next to and inside LaTeX commands
+BIB_QUOTED_LATEX_COMMANDS = """@InProceedings{test24,
+  title = {Test Title},
+  author = {Test Author},
+  pages = {1-10},
+  abstract = {Using \\alpha and "quoted" text with \\emph{\\textbf{"nested"}} commands.}
+}"""
+
+def test_quote_handling_with_latex_commands(tmp_path, base_proceedings):
+    """Test that LaTeX commands are kept intact and quotes around them are still replaced"""
+    input_file = tmp_path / "test.bib"
+    output_file = tmp_path / "test_fixed.bib"
+    
+    input_file.write_text(base_proceedings + BIB_QUOTED_LATEX_COMMANDS, encoding='utf-8')
+
+    check_and_fix_bibtex(str(input_file), str(output_file))
+    
+    content = Path(output_file).read_text(encoding='utf-8')
+    
+    assert 'Using \\alpha and ``quoted\'\' text with \\emph{\\textbf{"nested"}} commands.' in content
+
+@pytest.mark.slow
+def test_loader_matches_bibtexparser():
+    """Test that the fast loader builds the same database as bibtexparser"""
+    content = Path('test/test-entries.bib').read_text(encoding='utf-8')
+    content += """
+@misc{macro24,
+  title = "Quoted {Title}",
+  month = jan,
+  year = 2024
+}
+"""
+    for text in (content.split('@misc')[0], content):
+        expected = bibtexparser.loads(text, make_parser())
+        loaded = load_bibtex(text, make_parser())
+        assert [list(entry.items()) for entry in loaded.entries] == \
+            [list(entry.items()) for entry in expected.entries]
+
+# Entry with quotes at the very start and end of fields
+BIB_QUOTED_FIELD_BOUNDARIES = """@InProceedings{test24,
+  title = {"Quoted Title"},
+  author = {Test Author},
+  pages = {1-10},
+  abstract = {Exponent x^"2" and the closing "quote"}
+}"""
+
+def test_quote_handling_at_field_boundaries(tmp_path, base_proceedings):
+    """Test that quotes at the very start or end of a field are not duplicated"""
+    input_file = tmp_path / "test.bib"
+    output_file = tmp_path / "test_fixed.bib"
+    
+    input_file.write_text(base_proceedings + BIB_QUOTED_FIELD_BOUNDARIES, encoding='utf-8')
+
+    check_and_fix_bibtex(str(input_file), str(output_file))
+    
+    content = Path(output_file).read_text(encoding='utf-8')
+    
+    assert 'title = {``Quoted Title\'\'}' in content
+    assert 'abstract = {Exponent x^``2\'\' and the closing ``quote\'\'}' in content
+
+@pytest.mark.slow
+def test_parallel_text_fixing(tmp_path, monkeypatch):
+    """Test that fixing text fields in worker processes gives the same output"""
+    serial_file = tmp_path / "serial.bib"
+    parallel_file = tmp_path / "parallel.bib"
+    check_and_fix_bibtex('test/test-entries.bib', str(serial_file))
+    
+    monkeypatch.setattr(core, 'PARALLEL_THRESHOLD', 1)
+    monkeypatch.setattr(core.os, 'cpu_count', lambda: 2)
+    check_and_fix_bibtex('test/test-entries.bib', str(parallel_file), parallel=True)
+    
+    assert parallel_file.read_text(encoding='utf-8') == serial_file.read_text(encoding='utf-8')
+
+def test_text_fixing_is_serial_by_default(tmp_path, monkeypatch):
+    """Test that library callers only get worker processes when they ask for them"""
+    def no_pool():
+        raise AssertionError("worker processes started without parallel=True")
+    monkeypatch.setattr(core, 'PARALLEL_THRESHOLD', 1)
+    monkeypatch.setattr(core.os, 'cpu_count', lambda: 2)
+    monkeypatch.setattr(core, 'ProcessPoolExecutor', no_pool)
+    check_and_fix_bibtex('test/test-entries.bib', str(tmp_path / "serial.bib"))
+
+# Entry whose abstract repeats a command argument with an escaped closing brace
+BIB_UNMATCHED_COMMAND_BRACES = """@InProceedings{test24,
+  title = {Test Title},
+  author = {Test Author},
+  pages = {1-10},
+  abstract = {""" + 'Escaped \\a{\\} brace and "quoted" text. ' * 5000 + """}
+}"""
+
+def test_quote_handling_with_unmatched_command_braces(tmp_path, base_proceedings):
+    """Test that command arguments without a closing brace are handled in linear time"""
+    input_file = tmp_path / "test.bib"
+    output_file = tmp_path / "test_fixed.bib"
+    
+    input_file.write_text(base_proceedings + BIB_UNMATCHED_COMMAND_BRACES, encoding='utf-8')
+
+    check_and_fix_bibtex(str(input_file), str(output_file))
+    
+    content = Path(output_file).read_text(encoding='utf-8')
+    
+    assert content.count('Escaped \\a{\\} brace and ``quoted\'\' text.') == 5000